@@ -35,7 +35,8 @@ const ChatBotDemo = () => {
   const [input, setInput] = useState('')
   const [model, setModel] = useState<string>(models[0].value)
   const [webSearch, setWebSearch] = useState(false)
-  const { messages, sendMessage, status, regenerate } = useChat()
+  // coalesce streamed deltas into one re-render per 50ms rather than one per token
+  const { messages, sendMessage, status, regenerate } = useChat({ experimental_throttle: 50 })
 
   const handleSubmit = (e: FormEvent) => {
     e.preventDefault()